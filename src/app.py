@@ -25,55 +25,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Competitive basketball team and practice",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["alex@mergington.edu"]
+        "participants": {"alex@mergington.edu"}
     },
     "Tennis Club": {
         "description": "Tennis coaching and match play",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["isabella@mergington.edu"]
+        "participants": {"isabella@mergington.edu"}
     },
     "Art Studio": {
         "description": "Painting, drawing, and visual arts",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["grace@mergington.edu"]
+        "participants": {"grace@mergington.edu"}
     },
     "Music Band": {
         "description": "Learn instruments and perform in concerts",
         "schedule": "Mondays and Fridays, 4:00 PM - 5:00 PM",
         "max_participants": 25,
-        "participants": ["lucas@mergington.edu"]
+        "participants": {"lucas@mergington.edu"}
     },
     "Robotics Club": {
         "description": "Design, build, and program robots",
         "schedule": "Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 18,
-        "participants": ["ryan@mergington.edu"]
+        "participants": {"ryan@mergington.edu"}
     },
     "Science Bowl": {
         "description": "Compete in science competitions and experiments",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["noah@mergington.edu"]
+        "participants": {"noah@mergington.edu"}
     }
 }
 
@@ -85,7 +85,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; return them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +107,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 @app.delete("/activities/{activity_name}/unregister")
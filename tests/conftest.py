@@ -0,0 +1,119 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pickle
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import AsyncClient, ASGITransport
+import sys
+from pathlib import Path
+
+# Add src directory to path to import app
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+# Initial activities state, built once and restored before each test
+_RAW = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+    },
+    "Basketball Team": {
+        "description": "Competitive basketball team and practice",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": {"alex@mergington.edu"}
+    },
+    "Tennis Club": {
+        "description": "Tennis coaching and match play",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": {"isabella@mergington.edu"}
+    },
+    "Art Studio": {
+        "description": "Painting, drawing, and visual arts",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": {"grace@mergington.edu"}
+    },
+    "Music Band": {
+        "description": "Learn instruments and perform in concerts",
+        "schedule": "Mondays and Fridays, 4:00 PM - 5:00 PM",
+        "max_participants": 25,
+        "participants": {"lucas@mergington.edu"}
+    },
+    "Robotics Club": {
+        "description": "Design, build, and program robots",
+        "schedule": "Thursdays, 3:30 PM - 5:30 PM",
+        "max_participants": 18,
+        "participants": {"ryan@mergington.edu"}
+    },
+    "Science Bowl": {
+        "description": "Compete in science competitions and experiments",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"noah@mergington.edu"}
+    }
+}
+
+# Pickled once; bytes are immutable and each load yields fresh mutable sets
+_BLOB = pickle.dumps(_RAW, protocol=5)
+
+
+@pytest.fixture(scope="session")
+def app_and_activities():
+    """Import the FastAPI app and its activities dict on first use"""
+    from app import app, activities
+    return app, activities
+
+
+@pytest.fixture(scope="session")
+def client(app_and_activities):
+    """Create a single test client for the FastAPI app, shared across the session"""
+    app, _ = app_and_activities
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(app_and_activities):
+    """Create a single async client dispatching in-process to the FastAPI app"""
+    app, _ = app_and_activities
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+def _restore_activities(activities):
+    """Restore the shared activities dict to its initial state"""
+    activities.clear()
+    activities.update(pickle.loads(_BLOB))
+
+
+@pytest.fixture(scope="session")
+def restore_activities_after_session(app_and_activities):
+    """Leave activities in their initial state once the whole session is done"""
+    _, activities = app_and_activities
+    yield activities
+    _restore_activities(activities)
+
+
+@pytest.fixture
+def reset_activities(restore_activities_after_session):
+    """Reset activities to initial state before each test"""
+    _restore_activities(restore_activities_after_session)
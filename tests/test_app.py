@@ -2,120 +2,94 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
+import json
+import fastjsonschema
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path to import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Percent-encoded request paths; emails are passed via params
+CHESS_CLUB_SIGNUP = "/activities/Chess%20Club/signup"
+CHESS_CLUB_UNREGISTER = "/activities/Chess%20Club/unregister"
+PROGRAMMING_CLASS_SIGNUP = "/activities/Programming%20Class/signup"
+GYM_CLASS_UNREGISTER = "/activities/Gym%20Class/unregister"
+TENNIS_CLUB_SIGNUP = "/activities/Tennis%20Club/signup"
+TENNIS_CLUB_UNREGISTER = "/activities/Tennis%20Club/unregister"
+ART_STUDIO_SIGNUP = "/activities/Art%20Studio/signup"
+MUSIC_BAND_SIGNUP = "/activities/Music%20Band/signup"
+ROBOTICS_CLUB_SIGNUP = "/activities/Robotics%20Club/signup"
+NONEXISTENT_CLUB_SIGNUP = "/activities/Nonexistent%20Club/signup"
+NONEXISTENT_CLUB_UNREGISTER = "/activities/Nonexistent%20Club/unregister"
 
-from app import app, activities
+# Compiled once at import; raises JsonSchemaException on an invalid activity
+validate_activity = fastjsonschema.compile({
+    "type": "object",
+    "required": ["description", "schedule", "max_participants", "participants"],
+    "properties": {
+        "description": {"type": "string"},
+        "schedule": {"type": "string"},
+        "max_participants": {"type": "integer"},
+        "participants": {"type": "array", "items": {"type": "string"}},
+    },
+})
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+async def call_asgi(app, method, path, query_string=b""):
+    """Dispatch a bodyless request straight to the ASGI app, bypassing httpx"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [],
+        "server": ("test", 80),
+        "client": ("test", 123),
+    }
+    request_sent = False
+    status_code = None
+    body = b""
 
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball team and practice",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Tennis coaching and match play",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and visual arts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["grace@mergington.edu"]
-        },
-        "Music Band": {
-            "description": "Learn instruments and perform in concerts",
-            "schedule": "Mondays and Fridays, 4:00 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["lucas@mergington.edu"]
-        },
-        "Robotics Club": {
-            "description": "Design, build, and program robots",
-            "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["ryan@mergington.edu"]
-        },
-        "Science Bowl": {
-            "description": "Compete in science competitions and experiments",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["noah@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_activities)
-    yield
-    
-    # Cleanup
-    activities.clear()
-    activities.update(original_activities)
+    async def send(message):
+        nonlocal status_code, body
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            body += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return status_code, body
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
-        """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+    @pytest.mark.asyncio
+    async def test_get_activities_returns_all_activities(self, app_and_activities, reset_activities):
+        """Test that GET /activities returns all activities with their initial state"""
+        app, _ = app_and_activities
+        status_code, body = await call_asgi(app, "GET", "/activities")
+        assert status_code == 200
+        data = json.loads(body)
         assert len(data) == 9
         assert "Chess Club" in data
         assert "Programming Class" in data
-    
-    def test_get_activities_has_required_fields(self, client, reset_activities):
-        """Test that activities have required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        activity = data["Chess Club"]
-        assert "description" in activity
-        assert "schedule" in activity
-        assert "max_participants" in activity
-        assert "participants" in activity
-    
-    def test_chess_club_has_correct_participants(self, client, reset_activities):
-        """Test that Chess Club has correct initial participants"""
-        response = client.get("/activities")
-        data = response.json()
-        assert data["Chess Club"]["participants"] == ["michael@mergington.edu", "daniel@mergington.edu"]
+        
+        # Activities have the required fields
+        validate_activity(data["Chess Club"])
+        
+        # Chess Club has its initial participants
+        assert data["Chess Club"]["participants"] == ["daniel@mergington.edu", "michael@mergington.edu"]
 
 
 class TestSignUpForActivity:
@@ -124,7 +98,7 @@ class TestSignUpForActivity:
     def test_signup_success(self, client, reset_activities):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
+            CHESS_CLUB_SIGNUP, params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
@@ -133,33 +107,15 @@ class TestSignUpForActivity:
     
     def test_signup_adds_participant_to_activity(self, client, reset_activities):
         """Test that signup actually adds participant to activity"""
-        client.post("/activities/Chess%20Club/signup?email=newstudent@mergington.edu")
+        client.post(CHESS_CLUB_SIGNUP, params={"email": "newstudent@mergington.edu"})
         response = client.get("/activities")
         data = response.json()
         assert "newstudent@mergington.edu" in data["Chess Club"]["participants"]
     
-    def test_signup_duplicate_email_fails(self, client, reset_activities):
-        """Test that signing up with duplicate email fails"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=michael@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
-    
-    def test_signup_nonexistent_activity_fails(self, client, reset_activities):
-        """Test that signing up for nonexistent activity fails"""
-        response = client.post(
-            "/activities/Nonexistent%20Club/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
     def test_signup_multiple_students(self, client, reset_activities):
         """Test signing up multiple students to same activity"""
-        client.post("/activities/Programming%20Class/signup?email=student1@mergington.edu")
-        client.post("/activities/Programming%20Class/signup?email=student2@mergington.edu")
+        client.post(PROGRAMMING_CLASS_SIGNUP, params={"email": "student1@mergington.edu"})
+        client.post(PROGRAMMING_CLASS_SIGNUP, params={"email": "student2@mergington.edu"})
         
         response = client.get("/activities")
         data = response.json()
@@ -175,7 +131,7 @@ class TestUnregisterFromActivity:
     def test_unregister_success(self, client, reset_activities):
         """Test successful unregister from an activity"""
         response = client.delete(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
+            CHESS_CLUB_UNREGISTER, params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
@@ -184,76 +140,87 @@ class TestUnregisterFromActivity:
     
     def test_unregister_removes_participant(self, client, reset_activities):
         """Test that unregister actually removes participant"""
-        client.delete("/activities/Chess%20Club/unregister?email=michael@mergington.edu")
+        client.delete(CHESS_CLUB_UNREGISTER, params={"email": "michael@mergington.edu"})
         response = client.get("/activities")
         data = response.json()
         assert "michael@mergington.edu" not in data["Chess Club"]["participants"]
         assert "daniel@mergington.edu" in data["Chess Club"]["participants"]
     
-    def test_unregister_nonexistent_activity_fails(self, client, reset_activities):
-        """Test that unregistering from nonexistent activity fails"""
-        response = client.delete(
-            "/activities/Nonexistent%20Club/unregister?email=michael@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
-    def test_unregister_not_signed_up_fails(self, client, reset_activities):
-        """Test that unregistering non-participant fails"""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=notstudent@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"]
-    
-    def test_unregister_multiple_participants(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_unregister_multiple_participants(self, async_client, reset_activities):
         """Test unregistering multiple participants"""
-        client.delete("/activities/Gym%20Class/unregister?email=john@mergington.edu")
-        client.delete("/activities/Gym%20Class/unregister?email=olivia@mergington.edu")
+        # Unregister both participants concurrently
+        responses = await asyncio.gather(
+            async_client.delete(GYM_CLASS_UNREGISTER, params={"email": "john@mergington.edu"}),
+            async_client.delete(GYM_CLASS_UNREGISTER, params={"email": "olivia@mergington.edu"}),
+        )
+        assert all(r.status_code == 200 for r in responses)
         
-        response = client.get("/activities")
+        response = await async_client.get("/activities")
         data = response.json()
         assert len(data["Gym Class"]["participants"]) == 0
 
 
+class TestInvalidRequests:
+    """Tests for signup and unregister requests that are rejected"""
+    
+    @pytest.mark.parametrize("method,url,email,status_code,expected_detail", [
+        pytest.param("post", CHESS_CLUB_SIGNUP, "michael@mergington.edu", 400,
+                     "already signed up", id="signup-duplicate-email"),
+        pytest.param("post", NONEXISTENT_CLUB_SIGNUP, "newstudent@mergington.edu", 404,
+                     "Activity not found", id="signup-nonexistent-activity"),
+        pytest.param("delete", NONEXISTENT_CLUB_UNREGISTER, "michael@mergington.edu", 404,
+                     "Activity not found", id="unregister-nonexistent-activity"),
+        pytest.param("delete", CHESS_CLUB_UNREGISTER, "notstudent@mergington.edu", 400,
+                     "not signed up", id="unregister-not-signed-up"),
+    ])
+    def test_request_fails(self, client, reset_activities, method, url, email,
+                           status_code, expected_detail):
+        """Test that invalid signup/unregister requests fail with a clear detail"""
+        response = getattr(client, method)(url, params={"email": email})
+        assert response.status_code == status_code
+        data = response.json()
+        assert expected_detail in data["detail"]
+
+
 class TestSignupAndUnregister:
     """Integration tests for signup and unregister"""
     
-    def test_signup_then_unregister(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_signup_then_unregister(self, async_client, reset_activities):
         """Test signing up and then unregistering"""
         # Sign up
-        response = client.post(
-            "/activities/Tennis%20Club/signup?email=newstudent@mergington.edu"
+        response = await async_client.post(
+            TENNIS_CLUB_SIGNUP, params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         
-        # Verify signup
-        response = client.get("/activities")
-        assert "newstudent@mergington.edu" in response.json()["Tennis Club"]["participants"]
-        
-        # Unregister
-        response = client.delete(
-            "/activities/Tennis%20Club/unregister?email=newstudent@mergington.edu"
+        # Unregister (only succeeds if the signup took effect)
+        response = await async_client.delete(
+            TENNIS_CLUB_UNREGISTER, params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         
         # Verify unregister
-        response = client.get("/activities")
-        assert "newstudent@mergington.edu" not in response.json()["Tennis Club"]["participants"]
+        response = await async_client.get("/activities")
+        data = response.json()
+        assert "newstudent@mergington.edu" not in data["Tennis Club"]["participants"]
     
-    def test_signup_same_student_multiple_activities(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_signup_same_student_multiple_activities(self, async_client, reset_activities):
         """Test same student signing up for multiple activities"""
         email = "versatile@mergington.edu"
         
-        # Sign up for multiple activities
-        client.post(f"/activities/Art%20Studio/signup?email={email}")
-        client.post(f"/activities/Music%20Band/signup?email={email}")
-        client.post(f"/activities/Robotics%20Club/signup?email={email}")
+        # Sign up for multiple activities concurrently
+        responses = await asyncio.gather(
+            async_client.post(ART_STUDIO_SIGNUP, params={"email": email}),
+            async_client.post(MUSIC_BAND_SIGNUP, params={"email": email}),
+            async_client.post(ROBOTICS_CLUB_SIGNUP, params={"email": email}),
+        )
+        assert all(r.status_code == 200 for r in responses)
         
         # Verify in all activities
-        response = client.get("/activities")
+        response = await async_client.get("/activities")
         data = response.json()
         assert email in data["Art Studio"]["participants"]
         assert email in data["Music Band"]["participants"]